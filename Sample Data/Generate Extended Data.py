@@ -1,126 +1,139 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
+import sys
 
-def generate_extended_sample_data(output_file='sales_data_extended.csv'):
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
 
-    np.random.seed(42)
-    random.seed(42)
-
-    products = [
-        'Laptop', 'Mouse', 'Keyboard', 'Monitor', 'Headphones',
-        'Webcam', 'USB Cable', 'Hard Drive', 'SSD', 'RAM',
-        'Graphics Card', 'Motherboard', 'Power Supply', 'Case', 'CPU Cooler'
-    ]
-
-    categories = {
-        'Laptop': 'Computers', 'Mouse': 'Accessories', 'Keyboard': 'Accessories',
-        'Monitor': 'Display', 'Headphones': 'Audio', 'Webcam': 'Accessories',
-        'USB Cable': 'Accessories', 'Hard Drive': 'Storage', 'SSD': 'Storage',
-        'RAM': 'Components', 'Graphics Card': 'Components',
-        'Motherboard': 'Components', 'Power Supply': 'Components',
-        'Case': 'Components', 'CPU Cooler': 'Components'
-    }
+products = [
+    'Laptop', 'Mouse', 'Keyboard', 'Monitor', 'Headphones',
+    'Webcam', 'USB Cable', 'Hard Drive', 'SSD', 'RAM',
+    'Graphics Card', 'Motherboard', 'Power Supply', 'Case', 'CPU Cooler'
+]
 
-    regions = ['North', 'South', 'East', 'West', 'Central']
-    customer_types = ['Regular', 'Premium', 'New', 'VIP']
+categories = {
+    'Laptop': 'Computers', 'Mouse': 'Accessories', 'Keyboard': 'Accessories',
+    'Monitor': 'Display', 'Headphones': 'Audio', 'Webcam': 'Accessories',
+    'USB Cable': 'Accessories', 'Hard Drive': 'Storage', 'SSD': 'Storage',
+    'RAM': 'Components', 'Graphics Card': 'Components',
+    'Motherboard': 'Components', 'Power Supply': 'Components',
+    'Case': 'Components', 'CPU Cooler': 'Components'
+}
 
-    base_prices = {
-        'Laptop': 850, 'Mouse': 25, 'Keyboard': 50, 'Monitor': 300,
-        'Headphones': 80, 'Webcam': 60, 'USB Cable': 10, 'Hard Drive': 100,
-        'SSD': 150, 'RAM': 80, 'Graphics Card': 500, 'Motherboard': 200,
-        'Power Supply': 90, 'Case': 70, 'CPU Cooler': 40
-    }
+regions = ['North', 'South', 'East', 'West', 'Central']
+customer_types = ['Regular', 'Premium', 'New', 'VIP']
+
+base_prices = {
+    'Laptop': 850, 'Mouse': 25, 'Keyboard': 50, 'Monitor': 300,
+    'Headphones': 80, 'Webcam': 60, 'USB Cable': 10, 'Hard Drive': 100,
+    'SSD': 150, 'RAM': 80, 'Graphics Card': 500, 'Motherboard': 200,
+    'Power Supply': 90, 'Case': 70, 'CPU Cooler': 40
+}
 
-    start_date = datetime(2022, 1, 1)
-    end_date = datetime(2023, 12, 31)
+start_date = datetime(2022, 1, 1)
+end_date = datetime(2023, 12, 31)
 
-    records = []
-    order_id = 10000
+product_arr = np.asarray(products)
+category_arr = np.asarray([categories[p] for p in products])
+base_prices_arr = np.asarray([base_prices[p] for p in products], dtype=np.float64)
 
-    current_date = start_date
-    month_counter = 0
 
-    while current_date <= end_date:
-        month_counter += 1
+def write_csv(df, output_file):
+    if pa is None:
+        df.to_csv(output_file, index=False)
+        return
 
-        growth_factor = 1 + (month_counter * 0.02)
+    pacsv.write_csv(
+        pa.Table.from_pandas(df, preserve_index=False),
+        output_file,
+        write_options=pacsv.WriteOptions(batch_size=16384)
+    )
 
-        if current_date.month in [11, 12]:
-            seasonal_factor = 1.4
-        elif current_date.month in [1, 2]:
-            seasonal_factor = 0.8
-        else:
-            seasonal_factor = 1.0
 
-        orders_this_month = int(200 * growth_factor * seasonal_factor * random.uniform(0.9, 1.1))
+def monthly_order_counts(rng):
+    month_starts = pd.date_range(start_date, end_date, freq='MS')
+    n_months = len(month_starts)
 
-        for _ in range(orders_this_month):
-            day_offset = random.randint(0, 27)
-            order_date = current_date + timedelta(days=day_offset)
+    growth_factor = 1 + np.arange(1, n_months + 1) * 0.02
 
-            if order_date > end_date:
-                break
+    seasonal_lookup = np.ones(13)
+    seasonal_lookup[[11, 12]] = 1.4
+    seasonal_lookup[[1, 2]] = 0.8
+    seasonal_factor = seasonal_lookup[month_starts.month]
 
-            product = random.choice(products)
-            category = categories[product]
-            quantity = random.randint(1, 8)
+    orders_per_month = (200 * growth_factor * seasonal_factor * rng.uniform(0.9, 1.1, n_months)).astype(int)
 
-            price = base_prices[product] * random.uniform(0.85, 1.15)
-            revenue = quantity * price
+    return month_starts.values.astype('datetime64[D]'), orders_per_month
 
-            region = random.choice(regions)
-            customer_type = random.choice(customer_types)
 
-            records.append({
-                'Order_ID': order_id,
-                'Order_Date': order_date.strftime('%Y-%m-%d'),
-                'Product': product,
-                'Category': category,
-                'Quantity': quantity,
-                'Price': round(price, 2),
-                'Revenue': round(revenue, 2),
-                'Region': region,
-                'Customer_Type': customer_type
-            })
+def generate_extended_sample_data(output_file='sales_data_extended.csv'):
+
+    rng = np.random.default_rng(42)
 
-            order_id += 1
+    month_starts, orders_per_month = monthly_order_counts(rng)
+    n_orders = orders_per_month.sum()
 
-        current_date = (current_date.replace(day=1) + timedelta(days=32)).replace(day=1)
+    day_offsets = rng.integers(0, 28, n_orders)
+    order_dates = np.repeat(month_starts, orders_per_month) + day_offsets.astype('timedelta64[D]')
 
-    df = pd.DataFrame(records)
+    product_idx = rng.integers(0, len(products), n_orders)
+    quantity = rng.integers(1, 9, n_orders).astype(float)
+    price = base_prices_arr[product_idx] * rng.uniform(0.85, 1.15, n_orders)
+    revenue = (quantity * price).round(2)
+    price = price.round(2)
 
-    total_records = len(df)
+    total_records = n_orders
     missing_revenue_count = int(total_records * 0.02)
     missing_price_count = int(total_records * 0.01)
     missing_quantity_count = int(total_records * 0.01)
+    duplicate_count = int(total_records * 0.015)
+    n_rows = total_records + duplicate_count
+    wrong_date_count = int(n_rows * 0.01)
+    wrong_revenue_count = int(n_rows * 0.02)
+
+    # One permutation sliced into disjoint index sets, one per issue type
+    issue_sizes = [missing_revenue_count, missing_price_count, missing_quantity_count,
+                    duplicate_count, wrong_date_count, wrong_revenue_count]
+    (missing_revenue_indices, missing_price_indices, missing_quantity_indices,
+     duplicate_indices, wrong_date_indices, wrong_revenue_indices, _) = np.split(
+        rng.permutation(total_records), np.cumsum(issue_sizes)
+    )
+
+    revenue[missing_revenue_indices] = np.nan
+    price[missing_price_indices] = np.nan
+    quantity[missing_quantity_indices] = np.nan
+
+    columns = {
+        'Order_ID': np.arange(10000, 10000 + n_orders, dtype=np.int64),
+        'Order_Date': order_dates,
+        'Product': product_arr[product_idx],
+        'Category': category_arr[product_idx],
+        'Quantity': quantity,
+        'Price': price,
+        'Revenue': revenue,
+        'Region': np.asarray(regions)[rng.integers(0, len(regions), n_orders)],
+        'Customer_Type': np.asarray(customer_types)[rng.integers(0, len(customer_types), n_orders)]
+    }
 
-    missing_revenue_indices = np.random.choice(df.index, size=missing_revenue_count, replace=False)
-    df.loc[missing_revenue_indices, 'Revenue'] = np.nan
-
-    missing_price_indices = np.random.choice(df.index, size=missing_price_count, replace=False)
-    df.loc[missing_price_indices, 'Price'] = np.nan
-
-    missing_quantity_indices = np.random.choice(df.index, size=missing_quantity_count, replace=False)
-    df.loc[missing_quantity_indices, 'Quantity'] = np.nan
+    columns = {c: np.concatenate([arr, arr[duplicate_indices]]) for c, arr in columns.items()}
 
-    duplicate_count = int(total_records * 0.015)
-    duplicate_indices = np.random.choice(df.index, size=duplicate_count, replace=False)
-    duplicates = df.loc[duplicate_indices].copy()
-    df = pd.concat([df, duplicates], ignore_index=True)
+    date_strings = np.datetime_as_string(columns['Order_Date'], unit='D')
+    date_strings[wrong_date_indices] = np.char.replace(date_strings[wrong_date_indices], '-', '/')
+    columns['Order_Date'] = date_strings
 
-    wrong_date_count = int(len(df) * 0.01)
-    wrong_date_indices = np.random.choice(df.index, size=wrong_date_count, replace=False)
-    df.loc[wrong_date_indices, 'Order_Date'] = df.loc[wrong_date_indices, 'Order_Date'].astype(str).str.replace('-', '/')
+    columns['Revenue'][wrong_revenue_indices] *= rng.uniform(1.3, 1.7)
 
-    wrong_revenue_count = int(len(df) * 0.02)
-    wrong_revenue_indices = np.random.choice(df.index, size=wrong_revenue_count, replace=False)
-    df.loc[wrong_revenue_indices, 'Revenue'] = df.loc[wrong_revenue_indices, 'Revenue'] * random.uniform(1.3, 1.7)
+    df = pd.DataFrame(columns, copy=False)
+    for col in ('Product', 'Category', 'Region', 'Customer_Type'):
+        df[col] = df[col].astype('category')
 
-    df = df.sample(frac=1).reset_index(drop=True)
+    df = df.iloc[rng.permutation(len(df))].reset_index(drop=True)
 
-    df.to_csv(output_file, index=False)
+    write_csv(df, output_file)
 
     print(f"✅ Generated {len(df)} records")
     print(f"📅 Date range: {df['Order_Date'].min()} to {df['Order_Date'].max()}")
@@ -133,7 +146,106 @@ def generate_extended_sample_data(output_file='sales_data_extended.csv'):
     print(f"   - {wrong_revenue_count} incorrect revenue calculations")
     print(f"\n💾 Saved to: {output_file}")
 
+
+def stream_extended_sample_data(output_file='sales_data_extended.csv'):
+    """Write the extended dataset one month at a time to keep memory O(batch).
+
+    Data quality issues are injected per batch with Bernoulli masks at the same
+    rates as generate_extended_sample_data, and rows are shuffled within each
+    month rather than across the whole file.
+    """
+    rng = np.random.default_rng(42)
+
+    month_starts, orders_per_month = monthly_order_counts(rng)
+    wrong_revenue_factor = rng.uniform(1.3, 1.7)
+
+    issue_counts = dict.fromkeys(
+        ['missing_revenue', 'missing_price', 'missing_quantity', 'duplicate', 'wrong_date', 'wrong_revenue'], 0
+    )
+    total_records = 0
+    next_order_id = 10000
+    writer = None
+
+    for month_start, n in zip(month_starts, orders_per_month):
+        order_ids = np.arange(next_order_id, next_order_id + n, dtype=np.int64)
+        next_order_id += n
+
+        order_dates = month_start + rng.integers(0, 28, n).astype('timedelta64[D]')
+        product_idx = rng.integers(0, len(products), n)
+        quantity = rng.integers(1, 9, n).astype(float)
+        price = base_prices_arr[product_idx] * rng.uniform(0.85, 1.15, n)
+        revenue = (quantity * price).round(2)
+        price = price.round(2)
+        region_idx = rng.integers(0, len(regions), n)
+        customer_idx = rng.integers(0, len(customer_types), n)
+
+        for name, arr, rate in (('missing_revenue', revenue, 0.02),
+                                ('missing_price', price, 0.01),
+                                ('missing_quantity', quantity, 0.01)):
+            mask = rng.random(n) < rate
+            arr[mask] = np.nan
+            issue_counts[name] += mask.sum()
+
+        rows = np.arange(n)
+        duplicate_rows = rows[rng.random(n) < 0.015]
+        issue_counts['duplicate'] += len(duplicate_rows)
+        rows = np.concatenate([rows, duplicate_rows])
+        rows = rows[rng.permutation(len(rows))]
+        n_rows = len(rows)
+
+        date_strings = np.datetime_as_string(order_dates[rows], unit='D')
+        wrong_date_mask = rng.random(n_rows) < 0.01
+        if wrong_date_mask.any():
+            date_strings[wrong_date_mask] = np.char.replace(date_strings[wrong_date_mask], '-', '/')
+        issue_counts['wrong_date'] += wrong_date_mask.sum()
+
+        batch_revenue = revenue[rows]
+        wrong_revenue_mask = rng.random(n_rows) < 0.02
+        batch_revenue[wrong_revenue_mask] *= wrong_revenue_factor
+        issue_counts['wrong_revenue'] += wrong_revenue_mask.sum()
+
+        batch = {
+            'Order_ID': order_ids[rows],
+            'Order_Date': date_strings,
+            'Product': product_arr[product_idx[rows]],
+            'Category': category_arr[product_idx[rows]],
+            'Quantity': quantity[rows],
+            'Price': price[rows],
+            'Revenue': batch_revenue,
+            'Region': np.asarray(regions)[region_idx[rows]],
+            'Customer_Type': np.asarray(customer_types)[customer_idx[rows]]
+        }
+        total_records += n_rows
+
+        if pa is None:
+            pd.DataFrame(batch).to_csv(output_file, mode='a' if total_records > n_rows else 'w',
+                                       header=total_records == n_rows, index=False)
+            continue
+
+        # from_pandas maps NaN to null so missing values are written as empty fields, as in the in-memory path
+        record_batch = pa.record_batch({c: pa.array(v, from_pandas=True) for c, v in batch.items()})
+        if writer is None:
+            writer = pacsv.CSVWriter(output_file, record_batch.schema)
+        writer.write_batch(record_batch)
+
+    if writer is not None:
+        writer.close()
+
+    print(f"✅ Generated {total_records} records")
+    print(f"\n📊 Data Quality Issues Introduced:")
+    print(f"   - {issue_counts['missing_revenue']} missing revenue values")
+    print(f"   - {issue_counts['missing_price']} missing price values")
+    print(f"   - {issue_counts['missing_quantity']} missing quantity values")
+    print(f"   - {issue_counts['duplicate']} duplicate orders")
+    print(f"   - {issue_counts['wrong_date']} inconsistent date formats")
+    print(f"   - {issue_counts['wrong_revenue']} incorrect revenue calculations")
+    print(f"\n💾 Saved to: {output_file}")
+
+
 if __name__ == "__main__":
-    generate_extended_sample_data('sales_data_extended.csv')
+    if '--stream' in sys.argv:
+        stream_extended_sample_data('sales_data_extended.csv')
+    else:
+        generate_extended_sample_data('sales_data_extended.csv')
     print("\n✨ Extended sample data generated successfully!")
     print("Use this file for more robust time-series analysis and forecasting.")
@@ -1,10 +1,12 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
 
-np.random.seed(42)
-random.seed(42)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
 
 products = [
     'Laptop', 'Mouse', 'Keyboard', 'Monitor', 'Headphones',
@@ -37,62 +39,73 @@ start_date = datetime(2021, 1, 1)
 end_date = datetime(2024, 12, 31)
 date_range = (end_date - start_date).days
 
-records = []
-order_id = 1000
-
-for i in range(5000):
-    order_date = start_date + timedelta(days=random.randint(0, date_range))
-    product = random.choice(products)
-    category = categories[product]
-    quantity = random.randint(1, 10)
-
-    base_prices = {
-        'Laptop': 800, 'Mouse': 25, 'Keyboard': 50, 'Monitor': 300,
-        'Headphones': 80, 'Webcam': 60, 'USB Cable': 10, 'Hard Drive': 100,
-        'SSD': 150, 'RAM': 80, 'Graphics Card': 500, 'Motherboard': 200,
-        'Power Supply': 90, 'Case': 70, 'CPU Cooler': 40
-    }
-
-    price = base_prices[product] * (1 + random.uniform(-0.2, 0.3))
-    revenue = quantity * price
-
-    region = random.choice(regions)
-    customer_type = random.choice(customer_types)
-
-    records.append({
-        'Order_ID': order_id,
-        'Order_Date': order_date.strftime('%Y-%m-%d'),
-        'Product': product,
-        'Category': category,
-        'Quantity': quantity,
-        'Price': round(price, 2),
-        'Revenue': round(revenue, 2),
-        'Region': region,
-        'Customer_Type': customer_type
-    })
-
-    order_id += 1
+base_prices = {
+    'Laptop': 800, 'Mouse': 25, 'Keyboard': 50, 'Monitor': 300,
+    'Headphones': 80, 'Webcam': 60, 'USB Cable': 10, 'Hard Drive': 100,
+    'SSD': 150, 'RAM': 80, 'Graphics Card': 500, 'Motherboard': 200,
+    'Power Supply': 90, 'Case': 70, 'CPU Cooler': 40
+}
 
-df = pd.DataFrame(records)
+rng = np.random.default_rng(42)
+n_orders = 5000
+
+product_arr = np.asarray(products)
+category_arr = np.asarray([categories[p] for p in products])
+base_prices_arr = np.asarray([base_prices[p] for p in products], dtype=np.float64)
+
+day_offsets = rng.integers(0, date_range + 1, n_orders)
+order_dates = np.datetime64(start_date, 'D') + day_offsets.astype('timedelta64[D]')
+
+prod_idx = rng.integers(0, len(products), n_orders)
+quantities = rng.integers(1, 11, n_orders).astype(float)
+prices = base_prices_arr[prod_idx] * (1 + rng.uniform(-0.2, 0.3, n_orders))
+revenue = (quantities * prices).round(2)
+prices = prices.round(2)
+
+region_idx = rng.integers(0, len(regions), n_orders)
+customer_idx = rng.integers(0, len(customer_types), n_orders)
+
+# One permutation sliced into disjoint index sets, one per issue type
+issue_indices = rng.permutation(n_orders)
+revenue[issue_indices[:50]] = np.nan
+prices[issue_indices[50:100]] = np.nan
+quantities[issue_indices[100:150]] = np.nan
+duplicate_indices = issue_indices[150:250]
+wrong_date_indices = issue_indices[250:300]
+wrong_revenue_indices = issue_indices[300:380]
+
+columns = {
+    'Order_ID': np.arange(1000, 1000 + n_orders, dtype=np.int64),
+    'Order_Date': np.datetime_as_string(order_dates, unit='D'),
+    'Product': product_arr[prod_idx],
+    'Category': category_arr[prod_idx],
+    'Quantity': quantities,
+    'Price': prices,
+    'Revenue': revenue,
+    'Region': np.asarray(regions)[region_idx],
+    'Customer_Type': np.asarray(customer_types)[customer_idx]
+}
 
-missing_indices = np.random.choice(df.index, size=150, replace=False)
-df.loc[missing_indices[:50], 'Revenue'] = np.nan
-df.loc[missing_indices[50:100], 'Price'] = np.nan
-df.loc[missing_indices[100:150], 'Quantity'] = np.nan
+columns = {c: np.concatenate([arr, arr[duplicate_indices]]) for c, arr in columns.items()}
 
-duplicate_indices = np.random.choice(df.index, size=100, replace=False)
-duplicates = df.loc[duplicate_indices].copy()
-df = pd.concat([df, duplicates], ignore_index=True)
+columns['Order_Date'][wrong_date_indices] = np.char.replace(columns['Order_Date'][wrong_date_indices], '-', '/')
 
-wrong_date_indices = np.random.choice(df.index, size=50, replace=False)
-df.loc[wrong_date_indices, 'Order_Date'] = df.loc[wrong_date_indices, 'Order_Date'].astype(str).str.replace('-', '/')
+columns['Revenue'][wrong_revenue_indices] *= 1.5
 
-wrong_revenue_indices = np.random.choice(df.index, size=80, replace=False)
-df.loc[wrong_revenue_indices, 'Revenue'] = df.loc[wrong_revenue_indices, 'Revenue'] * 1.5
+df = pd.DataFrame(columns, copy=False)
+for col in ('Product', 'Category', 'Region', 'Customer_Type'):
+    df[col] = df[col].astype('category')
 
-df = df.sample(frac=1).reset_index(drop=True)
+df = df.iloc[rng.permutation(len(df))].reset_index(drop=True)
 
-df.to_csv('data/sales_data.csv', index=False)
+if pa is not None:
+    pacsv.write_csv(
+        pa.Table.from_pandas(df, preserve_index=False),
+        'data/sales_data.csv',
+        write_options=pacsv.WriteOptions(batch_size=16384)
+    )
+else:
+    df.to_csv('data/sales_data.csv', index=False)
 
 print(f"Generated {len(df)} records with intentional data quality issues:")
 print(f"- Missing values in Revenue, Price, Quantity")
@@ -2,7 +2,9 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
+import io
 from datetime import datetime, timedelta
 import sys
 import os
@@ -26,37 +28,169 @@ sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (10, 6)
 
 
+@st.cache_data(show_spinner=False)
+def run_pipeline(file_source, modified_time=None):
+    """Run the load/clean/feature pipeline; cached per source and file modification time."""
+    if isinstance(file_source, str):
+        df = DataLoader.load_data(file_path=file_source)
+    else:
+        df = DataLoader.load_data(uploaded_file=file_source)
+
+    if df is None:
+        return None, None
+
+    cleaner = DataCleaner()
+    df_clean, cleaning_log = cleaner.clean_data(df)
+
+    df_enhanced = FeatureEngineer.create_features(df_clean)
+
+    df_enhanced.attrs['fingerprint'] = int(pd.util.hash_pandas_object(df, index=False).sum())
+
+    return df_enhanced, cleaning_log
+
+
 def load_and_process_data(file_source):
     """Load and process sales data through complete pipeline."""
-    with st.spinner("Loading data..."):
-        if isinstance(file_source, str):
-            df = DataLoader.load_data(file_path=file_source)
-        else:
-            df = DataLoader.load_data(uploaded_file=file_source)
+    with st.spinner("Processing data..."):
+        # A missing path is left to DataLoader, which reports it to the user
+        is_file = isinstance(file_source, str) and os.path.isfile(file_source)
+        modified_time = os.path.getmtime(file_source) if is_file else None
+        df_enhanced, cleaning_log = run_pipeline(file_source, modified_time)
+
+    if df_enhanced is None:
+        return None, None
+
+    with st.expander("📋 Data Cleaning Log"):
+        for log in cleaning_log:
+            st.text(log)
+
+    return df_enhanced, cleaning_log
+
+
+@st.cache_data(show_spinner=False)
+def compute_analytics(fingerprint, filter_key, _df):
+    """Compute the analysis report and KPIs, cached per dataset and filter selection."""
+    report = SalesAnalytics(_df).get_full_analysis_report()
+    metrics = FeatureEngineer.create_aggregated_metrics(_df)
+    return report, metrics
+
+
+def figure_to_png(fig):
+    """Render a Matplotlib figure to PNG bytes."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png')
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def render_top_products_chart(products, revenue):
+    """Horizontal bar chart of the top products by revenue."""
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    pd.Series(revenue, index=products).plot(kind='barh', ax=ax, color='#2E86AB')
+    ax.set_xlabel('Revenue ($)')
+    ax.set_title('Top 5 Products by Revenue')
+    fig.tight_layout()
+    return figure_to_png(fig)
+
+
+@st.cache_data(show_spinner=False)
+def render_category_pie_chart(categories, revenue):
+    """Pie chart of the revenue split across categories."""
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    ax.pie(
+        revenue,
+        labels=categories,
+        autopct='%1.1f%%',
+        startangle=90,
+        colors=sns.color_palette('Set2')
+    )
+    ax.set_title('Revenue Distribution by Category')
+    return figure_to_png(fig)
 
-        if df is None:
-            return None, None, None
 
-    with st.spinner("Cleaning data..."):
-        cleaner = DataCleaner()
-        df_clean, cleaning_log = cleaner.clean_data(df)
+@st.cache_data(show_spinner=False)
+def render_regional_chart(regions, revenue):
+    """Bar chart of total revenue per region."""
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    pd.Series(revenue, index=regions).plot(kind='bar', ax=ax, color='#A23B72')
+    ax.set_xlabel('Region')
+    ax.set_ylabel('Revenue ($)')
+    ax.set_title('Total Revenue by Region')
+    ax.tick_params(axis='x', labelrotation=45)
+    fig.tight_layout()
+    return figure_to_png(fig)
+
+
+@st.cache_data(show_spinner=False)
+def render_monthly_trend_chart(months, revenue):
+    """Line chart of revenue per month."""
+    fig = Figure(figsize=(14, 6))
+    ax = fig.subplots()
+    ax.plot(months, revenue, marker='o', linewidth=2, markersize=8, color='#F18F01')
+    ax.set_xlabel('Month')
+    ax.set_ylabel('Revenue ($)')
+    ax.set_title('Monthly Revenue Trend')
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    return figure_to_png(fig)
+
+
+@st.cache_data(show_spinner=False)
+def render_forecast_chart(method, historical, forecast, lower, upper):
+    """Historical sales followed by the forecast and its confidence band."""
+    fig = Figure(figsize=(14, 7))
+    ax = fig.subplots()
+
+    ax.plot(
+        range(len(historical)),
+        historical,
+        label='Historical Sales',
+        marker='o',
+        linewidth=2,
+        markersize=6,
+        color='#2E86AB'
+    )
 
-        with st.expander("📋 Data Cleaning Log"):
-            for log in cleaning_log:
-                st.text(log)
+    forecast_x = range(len(historical), len(historical) + len(forecast))
+    ax.plot(
+        forecast_x,
+        forecast,
+        label='Forecast',
+        marker='s',
+        linewidth=2,
+        markersize=6,
+        color='#F18F01',
+        linestyle='--'
+    )
 
-    with st.spinner("Engineering features..."):
-        df_enhanced = FeatureEngineer.create_features(df_clean)
+    ax.fill_between(
+        forecast_x,
+        lower,
+        upper,
+        alpha=0.3,
+        color='#F18F01',
+        label='95% Confidence Interval'
+    )
 
-    return df_enhanced, df, cleaning_log
+    ax.axvline(x=len(historical)-0.5, color='red', linestyle=':', linewidth=2, label='Forecast Start')
 
+    ax.set_xlabel('Time Period (Months)')
+    ax.set_ylabel('Revenue ($)')
+    ax.set_title(f'Sales Forecast - {method}')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    return figure_to_png(fig)
 
-def display_overview_metrics(df):
+
+def display_overview_metrics(metrics):
     """Display key performance indicators."""
     st.header("📈 Executive Summary")
 
-    metrics = FeatureEngineer.create_aggregated_metrics(df)
-
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
@@ -97,12 +231,10 @@ def display_overview_metrics(df):
         st.metric("Date Range", f"{metrics['date_range']['start']} to {metrics['date_range']['end']}")
 
 
-def display_sales_performance(analytics):
+def display_sales_performance(performance):
     """Display sales performance analysis."""
     st.header("💰 Sales Performance Analysis")
 
-    performance = analytics.analyze_sales_performance()
-
     col1, col2 = st.columns(2)
 
     with col1:
@@ -133,30 +265,26 @@ def display_sales_performance(analytics):
                 st.info("📊 Stable performance")
 
 
-def display_product_analysis(analytics):
+def display_product_analysis(product_data, category_data):
     """Display product performance analysis."""
     st.header("🏷️ Product Performance")
 
-    product_data = analytics.analyze_products()
-
     col1, col2 = st.columns(2)
 
     with col1:
         st.subheader("Top 5 Products by Revenue")
-        top_products = pd.DataFrame(product_data['top_5_products']).T
+        top_products = product_data['top_5_products']
         top_products = top_products[['Revenue', 'Order_Count', 'Revenue_Share_%']].round(2)
         st.dataframe(top_products, use_container_width=True)
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-        top_products['Revenue'].plot(kind='barh', ax=ax, color='#2E86AB')
-        ax.set_xlabel('Revenue ($)')
-        ax.set_title('Top 5 Products by Revenue')
-        plt.tight_layout()
-        st.pyplot(fig)
+        st.image(render_top_products_chart(
+            tuple(top_products.index),
+            tuple(top_products['Revenue'])
+        ))
 
     with col2:
         st.subheader("Bottom 5 Products by Revenue")
-        bottom_products = pd.DataFrame(product_data['bottom_5_products']).T
+        bottom_products = product_data['bottom_5_products']
         bottom_products = bottom_products[['Revenue', 'Order_Count', 'Revenue_Share_%']].round(2)
         st.dataframe(bottom_products, use_container_width=True)
 
@@ -164,29 +292,21 @@ def display_product_analysis(analytics):
                 f"generate 80% of revenue")
 
     st.subheader("Category Performance")
-    category_data = analytics.analyze_categories()
-    category_df = pd.DataFrame(category_data['category_performance']).T
+    category_df = category_data['category_performance']
     category_df = category_df.round(2)
     st.dataframe(category_df, use_container_width=True)
 
-    fig, ax = plt.subplots(figsize=(10, 6))
-    ax.pie(
-        category_df['Total_Revenue'],
-        labels=category_df.index,
-        autopct='%1.1f%%',
-        startangle=90,
-        colors=sns.color_palette('Set2')
-    )
-    ax.set_title('Revenue Distribution by Category')
-    st.pyplot(fig)
+    st.image(render_category_pie_chart(
+        tuple(category_df.index),
+        tuple(category_df['Total_Revenue'])
+    ))
 
 
-def display_regional_analysis(analytics):
+def display_regional_analysis(regional_data):
     """Display regional performance analysis."""
     st.header("🗺️ Regional Performance")
 
-    regional_data = analytics.analyze_regions()
-    regional_df = pd.DataFrame(regional_data['regional_performance']).T
+    regional_df = regional_data['regional_performance']
     regional_df = regional_df.round(2)
 
     col1, col2 = st.columns(2)
@@ -197,35 +317,22 @@ def display_regional_analysis(analytics):
 
     with col2:
         st.subheader("Revenue by Region")
-        fig, ax = plt.subplots(figsize=(10, 6))
-        regional_df['Total_Revenue'].plot(kind='bar', ax=ax, color='#A23B72')
-        ax.set_xlabel('Region')
-        ax.set_ylabel('Revenue ($)')
-        ax.set_title('Total Revenue by Region')
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        st.pyplot(fig)
+        st.image(render_regional_chart(
+            tuple(regional_df.index),
+            tuple(regional_df['Total_Revenue'])
+        ))
 
 
-def display_time_trends(analytics, df):
+def display_time_trends(trends):
     """Display time-based trend analysis."""
     st.header("📅 Time-Based Trends")
 
-    trends = analytics.analyze_time_trends()
-
     st.subheader("Monthly Revenue Trend")
-    monthly_df = pd.DataFrame(trends['monthly_trends']).T
-
-    fig, ax = plt.subplots(figsize=(14, 6))
-    monthly_df.index = monthly_df.index.astype(str)
-    ax.plot(monthly_df.index, monthly_df['Revenue'], marker='o', linewidth=2, markersize=8, color='#F18F01')
-    ax.set_xlabel('Month')
-    ax.set_ylabel('Revenue ($)')
-    ax.set_title('Monthly Revenue Trend')
-    plt.xticks(rotation=45, ha='right')
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    st.pyplot(fig)
+    monthly_df = trends['monthly_trends'].set_axis(trends['monthly_trends'].index.astype(str))
+    st.image(render_monthly_trend_chart(
+        tuple(monthly_df.index),
+        tuple(monthly_df['Revenue'])
+    ))
 
     col1, col2 = st.columns(2)
 
@@ -239,13 +346,24 @@ def display_time_trends(analytics, df):
         growth_df = monthly_df[['Revenue_Growth_%']].dropna().round(2)
         st.dataframe(growth_df, use_container_width=True)
 
-    if trends['yearly_trends']:
+    if trends['yearly_trends'] is not None:
         st.subheader("Yearly Comparison")
-        yearly_df = pd.DataFrame(trends['yearly_trends']).T
-        st.dataframe(yearly_df, use_container_width=True)
+        st.dataframe(trends['yearly_trends'], use_container_width=True)
+
+
+def get_forecaster(df, cache_key):
+    """Reuse one forecaster per dataset and filter selection so its fitted models survive reruns."""
+    cached = st.session_state.get('forecaster')
+    if cached is None or cached[0] != cache_key:
+        cached = (cache_key, SalesForecaster(df))
+        st.session_state['forecaster'] = cached
 
+    forecaster = cached[1]
+    forecaster.df = df
+    return forecaster
 
-def display_forecasting(df):
+
+def display_forecasting(df, cache_key):
     """Display sales forecasting section."""
     st.header("🔮 Sales Forecasting")
 
@@ -295,7 +413,7 @@ def display_forecasting(df):
             "ARIMA": "arima"
         }
 
-        forecaster = SalesForecaster(df)
+        forecaster = get_forecaster(df, cache_key)
 
         with st.spinner(f"Generating {forecast_method} forecast..."):
             result = forecaster.generate_forecast(
@@ -313,53 +431,16 @@ def display_forecasting(df):
             with col1:
                 st.subheader("Forecast Visualization")
 
-                fig, ax = plt.subplots(figsize=(14, 7))
-
                 historical = result['historical_data']
-                forecast = result['forecast']
-                lower = result['lower_bound']
-                upper = result['upper_bound']
-
-                ax.plot(
-                    range(len(historical)),
-                    historical.values,
-                    label='Historical Sales',
-                    marker='o',
-                    linewidth=2,
-                    markersize=6,
-                    color='#2E86AB'
-                )
-
-                forecast_x = range(len(historical), len(historical) + len(forecast))
-                ax.plot(
-                    forecast_x,
-                    forecast.values,
-                    label='Forecast',
-                    marker='s',
-                    linewidth=2,
-                    markersize=6,
-                    color='#F18F01',
-                    linestyle='--'
-                )
-
-                ax.fill_between(
-                    forecast_x,
-                    lower.values,
-                    upper.values,
-                    alpha=0.3,
-                    color='#F18F01',
-                    label='95% Confidence Interval'
-                )
-
-                ax.axvline(x=len(historical)-0.5, color='red', linestyle=':', linewidth=2, label='Forecast Start')
-
-                ax.set_xlabel('Time Period (Months)')
-                ax.set_ylabel('Revenue ($)')
-                ax.set_title(f'Sales Forecast - {result["method"]}')
-                ax.legend()
-                ax.grid(True, alpha=0.3)
-                plt.tight_layout()
-                st.pyplot(fig)
+                forecast_frame = result['forecast_frame']
+
+                st.image(render_forecast_chart(
+                    result['method'],
+                    tuple(historical.values),
+                    tuple(forecast_frame['forecast'].values),
+                    tuple(forecast_frame['lower'].values),
+                    tuple(forecast_frame['upper'].values)
+                ))
 
             with col2:
                 st.subheader("Forecast Details")
@@ -398,12 +479,10 @@ def display_forecasting(df):
 
             with col2:
                 st.markdown("**Forecast Data**")
-                forecast_df = pd.DataFrame({
-                    'Month': forecast.index.strftime('%Y-%m'),
-                    'Forecast': forecast.values.round(2),
-                    'Lower Bound': lower.values.round(2),
-                    'Upper Bound': upper.values.round(2)
+                forecast_df = forecast_frame.round(2).rename(columns={
+                    'forecast': 'Forecast', 'lower': 'Lower Bound', 'upper': 'Upper Bound'
                 })
+                forecast_df.insert(0, 'Month', forecast_frame.index.strftime('%Y-%m'))
                 st.dataframe(forecast_df, use_container_width=True, hide_index=True)
 
 
@@ -449,7 +528,7 @@ def main():
     else:
         file_source = "data/sales_data_sample.csv"
 
-    df_processed, df_raw, cleaning_log = load_and_process_data(file_source)
+    df_processed, cleaning_log = load_and_process_data(file_source)
 
     if df_processed is None:
         st.error("Failed to load data. Please check the file format and try again.")
@@ -463,11 +542,12 @@ def main():
     st.sidebar.markdown("---")
     date_filter = st.sidebar.checkbox("Enable Date Filtering")
 
-    df_filtered = df_processed.copy()
+    mask = np.ones(len(df_processed), dtype=bool)
+    date_key = None
 
     if date_filter:
-        min_date = pd.to_datetime(df_processed['Order_Date']).min()
-        max_date = pd.to_datetime(df_processed['Order_Date']).max()
+        min_date = df_processed['Order_Date'].min()
+        max_date = df_processed['Order_Date'].max()
 
         date_range = st.sidebar.date_input(
             "Select Date Range",
@@ -477,33 +557,39 @@ def main():
         )
 
         if len(date_range) == 2:
-            df_filtered = df_filtered[
-                (pd.to_datetime(df_filtered['Order_Date']) >= pd.to_datetime(date_range[0])) &
-                (pd.to_datetime(df_filtered['Order_Date']) <= pd.to_datetime(date_range[1]))
-            ]
+            date_key = tuple(date_range)
+            mask &= (
+                (df_processed['Order_Date'] >= pd.Timestamp(date_range[0])) &
+                (df_processed['Order_Date'] <= pd.Timestamp(date_range[1]))
+            ).to_numpy()
 
+    all_regions = df_processed['Region'].cat.categories.tolist()
     region_filter = st.sidebar.multiselect(
         "Filter by Region",
-        options=df_processed['Region'].unique(),
-        default=df_processed['Region'].unique()
+        options=all_regions,
+        default=all_regions
     )
 
     if region_filter:
-        df_filtered = df_filtered[df_filtered['Region'].isin(region_filter)]
+        mask &= df_processed['Region'].isin(region_filter).to_numpy()
 
+    all_categories = df_processed['Category'].cat.categories.tolist()
     category_filter = st.sidebar.multiselect(
         "Filter by Category",
-        options=df_processed['Category'].unique(),
-        default=df_processed['Category'].unique()
+        options=all_categories,
+        default=all_categories
     )
 
     if category_filter:
-        df_filtered = df_filtered[df_filtered['Category'].isin(category_filter)]
+        mask &= df_processed['Category'].isin(category_filter).to_numpy()
+
+    df_filtered = df_processed if mask.all() else df_processed[mask]
 
     st.sidebar.markdown("---")
     st.sidebar.info(f"**Filtered Records:** {len(df_filtered):,}")
 
-    analytics = SalesAnalytics(df_filtered)
+    filter_key = (date_key, tuple(region_filter), tuple(category_filter))
+    report, metrics = compute_analytics(df_processed.attrs['fingerprint'], filter_key, df_filtered)
 
     tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
         "📈 Overview",
@@ -515,22 +601,22 @@ def main():
     ])
 
     with tab1:
-        display_overview_metrics(df_filtered)
+        display_overview_metrics(metrics)
 
     with tab2:
-        display_sales_performance(analytics)
+        display_sales_performance(report['sales_performance'])
 
     with tab3:
-        display_product_analysis(analytics)
+        display_product_analysis(report['product_analysis'], report['category_analysis'])
 
     with tab4:
-        display_regional_analysis(analytics)
+        display_regional_analysis(report['regional_analysis'])
 
     with tab5:
-        display_time_trends(analytics, df_filtered)
+        display_time_trends(report['time_trends'])
 
     with tab6:
-        display_forecasting(df_filtered)
+        display_forecasting(df_filtered, (df_processed.attrs['fingerprint'], filter_key))
 
     st.sidebar.markdown("---")
     st.sidebar.markdown("### About")
@@ -1,6 +1,13 @@
 __version__ = "1.0.0"
 __author__ = "Aditya Garg"
 
+import pandas as pd
+
+# Copy-on-Write is always on from pandas 3; opt in on 2.x so the pipeline stages can
+# start from shallow copies instead of deep-copying their input frames
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
 from .data_loader import DataLoader
 from .data_cleaner import DataCleaner
 from .feature_engineer import FeatureEngineer
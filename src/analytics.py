@@ -5,8 +5,13 @@ from typing import Dict, Tuple
 
 class SalesAnalytics:
 
+    DIMENSIONS = ['Product', 'Category', 'Region', 'Customer_Type']
+
     def __init__(self, df: pd.DataFrame):
         self.df = df
+        self._dimension_totals = None
+        self._monthly_totals_cache = None
+        self._report_cache = None
 
     def analyze_sales_performance(self) -> Dict:
         performance = {
@@ -18,7 +23,7 @@ class SalesAnalytics:
             'avg_units_per_order': self.df['Quantity'].mean()
         }
 
-        monthly_revenue = self.df.groupby('Year_Month')['Revenue'].sum().sort_index()
+        monthly_revenue = self._monthly_totals()['Revenue']
         if len(monthly_revenue) >= 2:
             recent_month = monthly_revenue.iloc[-1]
             previous_month = monthly_revenue.iloc[-2]
@@ -28,22 +33,21 @@ class SalesAnalytics:
         return performance
 
     def analyze_products(self) -> Dict:
-        product_revenue = self.df.groupby('Product').agg({
-            'Revenue': 'sum',
-            'Quantity': 'sum',
-            'Order_ID': 'count'
-        }).rename(columns={'Order_ID': 'Order_Count'})
+        product_revenue = self._rollup('Product')
 
         product_revenue = product_revenue.sort_values('Revenue', ascending=False)
 
         product_revenue['Revenue_Share_%'] = (product_revenue['Revenue'] / product_revenue['Revenue'].sum() * 100)
         product_revenue['Cumulative_Revenue_Share_%'] = product_revenue['Revenue_Share_%'].cumsum()
 
-        top_5_products = product_revenue.head(5).to_dict('index')
-        bottom_5_products = product_revenue.tail(5).to_dict('index')
+        top_5_products = product_revenue.head(5)
+        bottom_5_products = product_revenue.tail(5)
 
         total_products = len(product_revenue)
-        products_80_pct_revenue = (product_revenue['Cumulative_Revenue_Share_%'] <= 80).sum()
+        # The cumulative share is non-decreasing, so a binary search finds the 80% cut-off
+        products_80_pct_revenue = int(np.searchsorted(
+            product_revenue['Cumulative_Revenue_Share_%'].to_numpy(), 80.0, side='right'
+        ))
         concentration_ratio = (products_80_pct_revenue / total_products * 100) if total_products > 0 else 0
 
         return {
@@ -51,96 +55,156 @@ class SalesAnalytics:
             'bottom_5_products': bottom_5_products,
             'total_products': total_products,
             'concentration_ratio': concentration_ratio,
-            'product_details': product_revenue.to_dict('index')
+            'product_details': product_revenue
         }
 
     def analyze_categories(self) -> Dict:
-        category_metrics = self.df.groupby('Category').agg({
-            'Revenue': ['sum', 'mean', 'count'],
-            'Quantity': 'sum'
-        })
-
-        category_metrics.columns = ['Total_Revenue', 'Avg_Order_Value', 'Order_Count', 'Units_Sold']
-        category_metrics = category_metrics.sort_values('Total_Revenue', ascending=False)
-
-        category_metrics['Revenue_Share_%'] = (category_metrics['Total_Revenue'] / category_metrics['Total_Revenue'].sum() * 100)
+        category_metrics = self._segment_metrics('Category', 'Units_Sold')
 
         return {
-            'category_performance': category_metrics.to_dict('index'),
+            'category_performance': category_metrics,
             'total_categories': len(category_metrics)
         }
 
     def analyze_regions(self) -> Dict:
-        regional_metrics = self.df.groupby('Region').agg({
-            'Revenue': ['sum', 'mean'],
-            'Order_ID': 'count',
-            'Quantity': 'sum'
-        })
-
-        regional_metrics.columns = ['Total_Revenue', 'Avg_Order_Value', 'Order_Count', 'Units_Sold']
-        regional_metrics = regional_metrics.sort_values('Total_Revenue', ascending=False)
-
-        regional_metrics['Revenue_Share_%'] = (regional_metrics['Total_Revenue'] / regional_metrics['Total_Revenue'].sum() * 100)
+        regional_metrics = self._segment_metrics('Region', 'Units_Sold')
 
         return {
-            'regional_performance': regional_metrics.to_dict('index'),
+            'regional_performance': regional_metrics,
             'total_regions': len(regional_metrics)
         }
 
     def analyze_time_trends(self) -> Dict:
-        monthly_trends = self.df.groupby('Year_Month').agg({
-            'Revenue': 'sum',
-            'Order_ID': 'count',
-            'Quantity': 'sum'
-        }).sort_index()
+        monthly_totals = self._monthly_totals()
 
-        monthly_trends.columns = ['Revenue', 'Orders', 'Units']
+        counts = monthly_totals[['Revenue', 'Orders']].to_numpy(dtype=np.float64)
+        growth = np.full_like(counts, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth[1:] = (counts[1:] - counts[:-1]) / counts[:-1] * 100
 
-        monthly_trends['Revenue_Growth_%'] = monthly_trends['Revenue'].pct_change() * 100
-        monthly_trends['Orders_Growth_%'] = monthly_trends['Orders'].pct_change() * 100
+        monthly_trends = monthly_totals.assign(**{
+            'Revenue_Growth_%': growth[:, 0],
+            'Orders_Growth_%': growth[:, 1]
+        })
 
-        if len(self.df['Year'].unique()) > 1:
-            yearly_trends = self.df.groupby('Year').agg({
-                'Revenue': 'sum',
-                'Order_ID': 'count'
-            })
-            yearly_trends.columns = ['Revenue', 'Orders']
-        else:
+        # Years and quarters roll up from the monthly totals instead of rescanning the orders
+        months = monthly_trends.index
+        monthly_counts = monthly_trends[['Revenue', 'Orders']]
+
+        yearly_trends = monthly_counts.groupby(pd.Index(months.year, name='Year')).sum()
+        if len(yearly_trends) <= 1:
             yearly_trends = None
 
-        quarterly_trends = self.df.groupby(['Year', 'Quarter']).agg({
-            'Revenue': 'sum',
-            'Order_ID': 'count'
-        })
-        quarterly_trends.columns = ['Revenue', 'Orders']
+        quarterly_trends = monthly_counts.groupby(
+            [pd.Index(months.year, name='Year'), pd.Index(months.quarter, name='Quarter')]
+        ).sum()
 
-        day_of_week_avg = self.df.groupby('Day_Name')['Revenue'].mean().sort_values(ascending=False)
+        day_of_week_avg = self.df.groupby('Day_Name', sort=False)['Revenue'].mean().sort_values(ascending=False)
 
         return {
-            'monthly_trends': monthly_trends.to_dict('index'),
-            'yearly_trends': yearly_trends.to_dict('index') if yearly_trends is not None else None,
-            'quarterly_trends': quarterly_trends.to_dict('index'),
+            'monthly_trends': monthly_trends,
+            'yearly_trends': yearly_trends,
+            'quarterly_trends': quarterly_trends,
             'day_of_week_patterns': day_of_week_avg.to_dict()
         }
 
     def analyze_customers(self) -> Dict:
-        customer_metrics = self.df.groupby('Customer_Type').agg({
-            'Revenue': ['sum', 'mean'],
-            'Order_ID': 'count',
-            'Quantity': 'sum'
-        })
-
-        customer_metrics.columns = ['Total_Revenue', 'Avg_Order_Value', 'Order_Count', 'Units_Purchased']
-        customer_metrics = customer_metrics.sort_values('Total_Revenue', ascending=False)
-
-        customer_metrics['Revenue_Share_%'] = (customer_metrics['Total_Revenue'] / customer_metrics['Total_Revenue'].sum() * 100)
+        customer_metrics = self._segment_metrics('Customer_Type', 'Units_Purchased')
 
         return {
-            'customer_segment_performance': customer_metrics.to_dict('index'),
+            'customer_segment_performance': customer_metrics,
             'total_segments': len(customer_metrics)
         }
 
+    def _dimension_cube(self) -> pd.DataFrame:
+        # One scan over the orders; every dimension-level view rolls up from this
+        if self._dimension_totals is None:
+            dimensions = [self.df[dim] for dim in self.DIMENSIONS]
+            if all(isinstance(col.dtype, pd.CategoricalDtype) for col in dimensions):
+                self._dimension_totals = self._categorical_cube(dimensions)
+            else:
+                self._dimension_totals = self.df.groupby(self.DIMENSIONS, observed=True, dropna=False, sort=False).agg(
+                    Revenue=('Revenue', 'sum'),
+                    Quantity=('Quantity', 'sum'),
+                    Order_Count=('Order_ID', 'count')
+                )
+
+        return self._dimension_totals
+
+    def _categorical_cube(self, dimensions: list) -> pd.DataFrame:
+        # Fold the category codes into one integer key per row (slot 0 of each
+        # dimension holds missing values) and sum with np.bincount
+        sizes = [len(col.cat.categories) + 1 for col in dimensions]
+        keys = np.zeros(len(self.df), dtype=np.int64)
+        for col, size in zip(dimensions, sizes):
+            keys = keys * size + col.cat.codes.to_numpy(dtype=np.int64) + 1
+
+        group_ids, unique_keys = pd.factorize(keys)
+        n_groups = len(unique_keys)
+
+        revenue = self.df['Revenue'].to_numpy(dtype=np.float64)
+        quantity = self.df['Quantity']
+        quantity_sum = np.bincount(group_ids, weights=np.nan_to_num(quantity.to_numpy(dtype=np.float64)),
+                                   minlength=n_groups)
+        if pd.api.types.is_integer_dtype(quantity.dtype):
+            quantity_sum = quantity_sum.astype(np.int64)
+
+        level_codes = np.unravel_index(unique_keys, sizes)
+        index = pd.MultiIndex.from_arrays(
+            [pd.Categorical.from_codes(codes - 1, dtype=col.dtype) for codes, col in zip(level_codes, dimensions)],
+            names=self.DIMENSIONS
+        )
+
+        return pd.DataFrame({
+            'Revenue': np.bincount(group_ids, weights=np.nan_to_num(revenue), minlength=n_groups),
+            'Quantity': quantity_sum,
+            'Order_Count': np.bincount(group_ids, weights=self.df['Order_ID'].notna().to_numpy(),
+                                       minlength=n_groups).astype(np.int64)
+        }, index=index)
+
+    def _monthly_totals(self) -> pd.DataFrame:
+        # Shared by the performance and trend views so Year_Month is grouped once
+        if self._monthly_totals_cache is None:
+            monthly_totals = self.df.groupby('Year_Month', sort=False).agg({
+                'Revenue': 'sum',
+                'Order_ID': 'count',
+                'Quantity': 'sum'
+            }).sort_index()
+            monthly_totals.columns = ['Revenue', 'Orders', 'Units']
+            if pd.api.types.is_integer_dtype(monthly_totals.index):
+                keys = monthly_totals.index.to_numpy(dtype=np.int64)
+                monthly_totals.index = pd.PeriodIndex.from_ordinals(
+                    (keys // 100 - 1970) * 12 + keys % 100 - 1, freq='M', name='Year_Month'
+                )
+            self._monthly_totals_cache = monthly_totals
+
+        return self._monthly_totals_cache
+
+    def _rollup(self, dimension: str) -> pd.DataFrame:
+        return self._dimension_cube().groupby(level=dimension, observed=True, sort=False).sum()
+
+    def _segment_metrics(self, dimension: str, units_column: str) -> pd.DataFrame:
+        totals = self._rollup(dimension)
+
+        metrics = pd.DataFrame({
+            'Total_Revenue': totals['Revenue'],
+            'Avg_Order_Value': totals['Revenue'] / totals['Order_Count'],
+            'Order_Count': totals['Order_Count'],
+            units_column: totals['Quantity']
+        })
+        metrics = metrics.sort_values('Total_Revenue', ascending=False)
+
+        metrics['Revenue_Share_%'] = (metrics['Total_Revenue'] / metrics['Total_Revenue'].sum() * 100)
+
+        return metrics
+
     def get_full_analysis_report(self) -> Dict:
+        if self._report_cache is None:
+            self._report_cache = self._build_full_report()
+
+        return self._report_cache
+
+    def _build_full_report(self) -> Dict:
         return {
             'sales_performance': self.analyze_sales_performance(),
             'product_analysis': self.analyze_products(),
@@ -3,20 +3,29 @@ import numpy as np
 import streamlit as st
 from typing import Tuple
 
+from .data_loader import DataLoader
+
 
 class DataCleaner:
     def __init__(self):
         self.cleaning_log = []
 
     def clean_data(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, list]:
-        df_clean = df.copy()
+        # A shallow copy keeps the caller's frame untouched; columns are only copied when written
+        df_clean = df.copy(deep=False)
         original_count = len(df_clean)
 
         self._log(f"Starting data cleaning with {original_count} records")
 
-        df_clean = self._standardize_dates(df_clean)
-        df_clean = self._handle_missing_values(df_clean)
-        df_clean = self._remove_duplicates(df_clean)
+        # Every row filter marks one shared keep-mask; the frame is sliced once at the end
+        keep = np.ones(original_count, dtype=bool)
+        keep = self._standardize_dates(df_clean, keep)
+        keep = self._handle_missing_values(df_clean, keep)
+        keep = self._remove_duplicates(df_clean, keep)
+        if not keep.all():
+            df_clean = df_clean[keep]
+
+        df_clean = self._fill_missing_values(df_clean)
         df_clean = self._fix_revenue_calculations(df_clean)
         df_clean = self._validate_data_types(df_clean)
         df_clean = self._handle_outliers(df_clean)
@@ -28,114 +37,134 @@ class DataCleaner:
 
         return df_clean, self.cleaning_log
 
-    def _standardize_dates(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _standardize_dates(self, df: pd.DataFrame, keep: np.ndarray) -> np.ndarray:
         self._log("Standardizing date formats...")
 
         try:
-            df['Order_Date'] = pd.to_datetime(df['Order_Date'], errors='coerce')
-
-            invalid_dates = df['Order_Date'].isna().sum()
-            if invalid_dates > 0:
-                self._log(f"⚠️  Found {invalid_dates} invalid dates - these orders will be removed")
-                df = df.dropna(subset=['Order_Date'])
+            if not pd.api.types.is_datetime64_any_dtype(df['Order_Date']):
+                df['Order_Date'] = DataLoader.parse_dates(df['Order_Date'])
 
-            df['Order_Date'] = df['Order_Date'].dt.date
+            invalid_dates = df['Order_Date'].isna().to_numpy() & keep
+            if invalid_dates.any():
+                self._log(f"⚠️  Found {invalid_dates.sum()} invalid dates - these orders will be removed")
+                keep = keep & ~invalid_dates
 
         except Exception as e:
             self._log(f"❌ Error in date standardization: {str(e)}")
 
-        return df
+        return keep
 
-    def _handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _handle_missing_values(self, df: pd.DataFrame, keep: np.ndarray) -> np.ndarray:
         self._log("Handling missing values...")
 
+        for col in ['Quantity', 'Price', 'Revenue']:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+
+        # One NA snapshot covers the critical fields plus Quantity and Price
         critical_cols = ['Order_ID', 'Product', 'Category']
-        before_count = len(df)
-        df = df.dropna(subset=critical_cols)
-        removed = before_count - len(df)
-        if removed > 0:
-            self._log(f"  → Removed {removed} orders with missing critical fields (ID/Product/Category)")
+        missing = df[critical_cols + ['Quantity', 'Price']].isna().to_numpy()
 
-        missing_qty = df['Quantity'].isna().sum()
-        missing_price = df['Price'].isna().sum()
+        missing_critical = missing[:, :len(critical_cols)].any(axis=1) & keep
+        keep = keep & ~missing_critical
+        if missing_critical.any():
+            self._log(f"  → Removed {missing_critical.sum()} orders with missing critical fields (ID/Product/Category)")
 
-        if missing_qty > 0:
-            self._log(f"  → Removing {missing_qty} orders with missing quantity")
-            df = df.dropna(subset=['Quantity'])
+        missing_qty = missing[:, -2] & keep
+        missing_price = missing[:, -1] & keep
 
-        if missing_price > 0:
-            self._log(f"  → Removing {missing_price} orders with missing price")
-            df = df.dropna(subset=['Price'])
+        if missing_qty.any():
+            self._log(f"  → Removing {missing_qty.sum()} orders with missing quantity")
 
-        missing_revenue = df['Revenue'].isna().sum()
-        if missing_revenue > 0:
-            self._log(f"  → Recalculating {missing_revenue} missing revenue values from Quantity × Price")
-            df.loc[df['Revenue'].isna(), 'Revenue'] = df['Quantity'] * df['Price']
+        if missing_price.any():
+            self._log(f"  → Removing {missing_price.sum()} orders with missing price")
 
-        if df['Region'].isna().any():
-            df['Region'].fillna('Unknown', inplace=True)
-            self._log(f"  → Filled missing regions with 'Unknown'")
+        return keep & ~missing_qty & ~missing_price
+
+    def _fill_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
+        missing_counts = df[['Revenue', 'Region', 'Customer_Type']].isna().sum()
+
+        if missing_counts['Revenue'] > 0:
+            self._log(f"  → Recalculating {missing_counts['Revenue']} missing revenue values from Quantity × Price")
+            df.loc[df['Revenue'].isna(), 'Revenue'] = df['Quantity'] * df['Price']
 
-        if df['Customer_Type'].isna().any():
-            df['Customer_Type'].fillna('Unknown', inplace=True)
-            self._log(f"  → Filled missing customer types with 'Unknown'")
+        for col, label in [('Region', 'regions'), ('Customer_Type', 'customer types')]:
+            if missing_counts[col] > 0:
+                df[col] = self._fill_unknown(df[col])
+                self._log(f"  → Filled missing {label} with 'Unknown'")
 
         return df
 
-    def _remove_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
-        before_count = len(df)
-        df = df.drop_duplicates(subset=['Order_ID'], keep='first')
-        removed = before_count - len(df)
+    @staticmethod
+    def _fill_unknown(series: pd.Series) -> pd.Series:
+        categorical = series.astype('category')
+        if 'Unknown' not in categorical.cat.categories:
+            categorical = categorical.cat.add_categories(['Unknown'])
+        return categorical.fillna('Unknown')
+
+    def _remove_duplicates(self, df: pd.DataFrame, keep: np.ndarray) -> np.ndarray:
+        # Only rows that survived the earlier filters can claim an Order_ID first
+        order_ids = df['Order_ID'][keep]
+
+        # Append-only exports have strictly increasing numeric IDs, which cannot repeat
+        ids = order_ids.to_numpy()
+        if ids.dtype.kind in 'iu' and (ids[1:] > ids[:-1]).all():
+            return keep
+
+        duplicate_mask = np.zeros(len(df), dtype=bool)
+        duplicate_mask[keep] = order_ids.duplicated(keep='first').to_numpy()
+        removed = duplicate_mask.sum()
 
         if removed > 0:
             self._log(f"  → Removed {removed} duplicate orders")
             self._log(f"     Reason: Prevents revenue double-counting in reports")
 
-        return df
+        return keep & ~duplicate_mask
 
     def _fix_revenue_calculations(self, df: pd.DataFrame) -> pd.DataFrame:
         self._log("Validating revenue calculations...")
 
-        df['Expected_Revenue'] = df['Quantity'] * df['Price']
+        revenue = df['Revenue'].to_numpy(dtype=np.float64)
+        expected_revenue = df['Quantity'].to_numpy(dtype=np.float64) * df['Price'].to_numpy(dtype=np.float64)
 
-        df['Revenue_Diff'] = abs(df['Revenue'] - df['Expected_Revenue'])
-        df['Revenue_Diff_Pct'] = (df['Revenue_Diff'] / df['Expected_Revenue']) * 100
+        # Same 1% tolerance as dividing by the expected revenue, without the division
+        incorrect_mask = np.abs(revenue - expected_revenue) > 0.01 * np.abs(expected_revenue)
 
-        incorrect_revenue = (df['Revenue_Diff_Pct'] > 1.0).sum()
+        incorrect_revenue = incorrect_mask.sum()
 
         if incorrect_revenue > 0:
             self._log(f"  → Found {incorrect_revenue} orders with incorrect revenue calculations")
             self._log(f"     Recalculating revenue as Quantity × Price")
 
-            df.loc[df['Revenue_Diff_Pct'] > 1.0, 'Revenue'] = df['Expected_Revenue']
-
-        df = df.drop(columns=['Expected_Revenue', 'Revenue_Diff', 'Revenue_Diff_Pct'])
+            df['Revenue'] = np.where(incorrect_mask, expected_revenue, revenue)
 
         return df
 
     def _validate_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
         self._log("Validating data types...")
 
-        numeric_cols = ['Quantity', 'Price', 'Revenue']
-        for col in numeric_cols:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+        quantity = df['Quantity']
+        if quantity.notna().all() and (quantity % 1 == 0).all():
+            df['Quantity'] = quantity.astype(np.int32)
+
+        df['Order_ID'] = df['Order_ID'].astype(pd.StringDtype('pyarrow'))
 
-        df['Order_ID'] = df['Order_ID'].astype(str)
-        df['Product'] = df['Product'].astype(str)
-        df['Category'] = df['Category'].astype(str)
-        df['Region'] = df['Region'].astype(str)
-        df['Customer_Type'] = df['Customer_Type'].astype(str)
+        for col in ['Product', 'Category', 'Region', 'Customer_Type']:
+            df[col] = df[col].astype('category')
 
         return df
 
     def _handle_outliers(self, df: pd.DataFrame) -> pd.DataFrame:
         self._log("Checking for outliers...")
 
-        for col in ['Quantity', 'Price', 'Revenue']:
-            mean = df[col].mean()
-            std = df[col].std()
-            outliers = ((df[col] - mean).abs() > 3 * std).sum()
-
+        numeric_cols = ['Quantity', 'Price', 'Revenue']
+        numeric = df[numeric_cols]
+        values = numeric.to_numpy(dtype=np.float64)
+        # pandas reductions dispatch to bottleneck's NaN-aware kernels when it is installed
+        mean = numeric.mean().to_numpy(dtype=np.float64)
+        std = numeric.std().to_numpy(dtype=np.float64)
+        outlier_counts = (np.abs(values - mean) > 3 * std).sum(axis=0)
+
+        for col, outliers in zip(numeric_cols, outlier_counts):
             if outliers > 0:
                 self._log(f"  ⚠️  Found {outliers} potential outliers in {col}")
                 self._log(f"     These may be legitimate bulk orders - review manually")
@@ -1,5 +1,7 @@
+import os
 import pandas as pd
 import streamlit as st
+from pandas.tseries.api import guess_datetime_format
 from typing import Optional
 
 
@@ -10,22 +12,33 @@ class DataLoader:
         'Quantity', 'Price', 'Revenue', 'Region', 'Customer_Type'
     ]
 
+    CSV_DTYPES = {
+        'Product': 'category',
+        'Category': 'category',
+        'Quantity': 'float64',
+        'Price': 'float64',
+        'Revenue': 'float64',
+        'Region': 'category',
+        'Customer_Type': 'category'
+    }
+
+    # Files above this size are parsed in chunks to bound peak memory
+    CHUNKED_READ_BYTES = 500 * 1024 * 1024
+    CSV_CHUNK_ROWS = 1_000_000
+
     @staticmethod
-    def load_data(file_path: str = None, uploaded_file=None) -> Optional[pd.DataFrame]:
+    def load_data(file_path: str = None, uploaded_file=None, columns: list = None) -> Optional[pd.DataFrame]:
+        columns = tuple(columns or DataLoader.REQUIRED_COLUMNS)
         try:
             if uploaded_file is not None:
-                if uploaded_file.name.endswith('.csv'):
-                    df = pd.read_csv(uploaded_file)
-                elif uploaded_file.name.endswith(('.xlsx', '.xls')):
-                    df = pd.read_excel(uploaded_file)
+                if uploaded_file.name.endswith(('.csv', '.xlsx', '.xls')):
+                    df = DataLoader._read_file(uploaded_file, uploaded_file.name, columns)
                 else:
                     st.error("Unsupported file format. Please upload CSV or Excel files.")
                     return None
             elif file_path:
-                if file_path.endswith('.csv'):
-                    df = pd.read_csv(file_path)
-                elif file_path.endswith(('.xlsx', '.xls')):
-                    df = pd.read_excel(file_path)
+                if file_path.endswith(('.csv', '.xlsx', '.xls')):
+                    df = DataLoader._read_file(file_path, file_path, columns)
                 else:
                     st.error("Unsupported file format. Please use CSV or Excel files.")
                     return None
@@ -35,6 +48,8 @@ class DataLoader:
 
             DataLoader._validate_columns(df)
 
+            df['Order_Date'] = DataLoader.parse_dates(df['Order_Date'])
+
             return df
 
         except FileNotFoundError:
@@ -47,6 +62,55 @@ class DataLoader:
             st.error(f"Error loading data: {str(e)}")
             return None
 
+    @staticmethod
+    def parse_dates(dates: pd.Series) -> pd.Series:
+        # Guess the dominant format once so the bulk parses on the strptime fast path;
+        # only the strings that miss it fall back to per-element mixed parsing
+        sample = dates.dropna()
+        fmt = guess_datetime_format(str(sample.iloc[0])) if len(sample) else None
+        if fmt is None:
+            return pd.to_datetime(dates, format='mixed', errors='coerce')
+
+        parsed = pd.to_datetime(dates, format=fmt, errors='coerce', cache=True)
+        unparsed = parsed.isna() & dates.notna()
+        if unparsed.any():
+            parsed[unparsed] = pd.to_datetime(dates[unparsed], format='mixed', errors='coerce')
+
+        return parsed
+
+    @staticmethod
+    def _read_file(source, name: str, columns: tuple) -> pd.DataFrame:
+        if name.endswith('.csv'):
+            return DataLoader._read_csv(source, columns)
+        return pd.read_excel(source, usecols=lambda col: col in columns)
+
+    @staticmethod
+    def _read_csv(source, columns: tuple) -> pd.DataFrame:
+        # Only the wanted columns are parsed; absent ones are left for _validate_columns to report
+        header = pd.read_csv(source, nrows=0).columns
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        usecols = [col for col in header if col in columns]
+        dtypes = {col: dtype for col, dtype in DataLoader.CSV_DTYPES.items() if col in usecols}
+
+        if isinstance(source, str) and os.path.getsize(source) > DataLoader.CHUNKED_READ_BYTES:
+            # Chunks are parsed without categories, which would not line up across chunks
+            categorical = [col for col, dtype in dtypes.items() if dtype == 'category']
+            chunk_dtypes = {col: dtype for col, dtype in dtypes.items() if dtype != 'category'}
+            chunks = pd.read_csv(source, usecols=usecols, dtype=chunk_dtypes, chunksize=DataLoader.CSV_CHUNK_ROWS)
+            df = pd.concat(chunks, ignore_index=True)
+            for col in categorical:
+                df[col] = df[col].astype('category')
+            return df
+
+        df = pd.read_csv(source, engine='pyarrow', usecols=usecols, dtype=dtypes)
+
+        # pyarrow hands the category codes over as read-only buffers; copy them so the frame stays writable
+        for col in df.select_dtypes('category').columns:
+            df[col] = df[col].copy()
+
+        return df
+
     @staticmethod
     def _validate_columns(df: pd.DataFrame) -> None:
         missing_cols = set(DataLoader.REQUIRED_COLUMNS) - set(df.columns)
@@ -5,9 +5,19 @@ from datetime import datetime
 
 class FeatureEngineer:
 
+    MONTH_NAMES = np.array([
+        'January', 'February', 'March', 'April', 'May', 'June',
+        'July', 'August', 'September', 'October', 'November', 'December'
+    ])
+
+    DAY_NAMES = np.array(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])
+
+    VALUE_TIERS = ['Low', 'Medium', 'High', 'Premium']
+
     @staticmethod
     def create_features(df: pd.DataFrame) -> pd.DataFrame:
-        df_enhanced = df.copy()
+        # Shallow under copy-on-write: the new feature columns never touch the caller's frame
+        df_enhanced = df.copy(deep=False)
 
         df_enhanced = FeatureEngineer._add_time_features(df_enhanced)
         df_enhanced = FeatureEngineer._add_revenue_features(df_enhanced)
@@ -17,19 +27,27 @@ class FeatureEngineer:
 
     @staticmethod
     def _add_time_features(df: pd.DataFrame) -> pd.DataFrame:
-        df['Order_Date'] = pd.to_datetime(df['Order_Date'])
-
-        df['Year'] = df['Order_Date'].dt.year
-        df['Quarter'] = df['Order_Date'].dt.quarter
-        df['Month'] = df['Order_Date'].dt.month
-        df['Month_Name'] = df['Order_Date'].dt.strftime('%B')
-        df['Day'] = df['Order_Date'].dt.day
-        df['Day_Name'] = df['Order_Date'].dt.strftime('%A')
+        if not pd.api.types.is_datetime64_any_dtype(df['Order_Date']):
+            df['Order_Date'] = pd.to_datetime(df['Order_Date'])
+
+        # Calendar fields come from integer arithmetic on one datetime64[D] array
+        days = df['Order_Date'].to_numpy().astype('datetime64[D]')
+        months = days.astype('datetime64[M]')
+        month_index = months.astype(np.int64) % 12
+        day_count = days.astype(np.int64)
+
+        df['Year'] = (days.astype('datetime64[Y]').astype(np.int64) + 1970).astype(np.int32)
+        df['Quarter'] = (month_index // 3 + 1).astype(np.int32)
+        df['Month'] = (month_index + 1).astype(np.int32)
+        df['Month_Name'] = FeatureEngineer.MONTH_NAMES[month_index]
+        df['Day'] = ((days - months).astype(np.int64) + 1).astype(np.int32)
+        # 1970-01-01 was a Thursday, index 3 with Monday as 0
+        df['Day_Name'] = FeatureEngineer.DAY_NAMES[(day_count + 3) % 7]
         df['Week_of_Year'] = df['Order_Date'].dt.isocalendar().week
-        df['Year_Month'] = df['Order_Date'].dt.to_period('M')
+        # YYYYMM integer key: groupbys hash plain int32s and only the aggregated index gets Period labels
+        df['Year_Month'] = df['Year'] * 100 + df['Month']
 
-        first_order_date = df['Order_Date'].min()
-        df['Days_Since_First_Order'] = (df['Order_Date'] - first_order_date).dt.days
+        df['Days_Since_First_Order'] = day_count - day_count.min()
 
         return df
 
@@ -38,11 +56,11 @@ class FeatureEngineer:
         avg_revenue = df['Revenue'].mean()
         df['AOV'] = avg_revenue
 
-        df['Order_Value_Tier'] = pd.cut(
-            df['Revenue'],
-            bins=[0, avg_revenue * 0.5, avg_revenue, avg_revenue * 2, float('inf')],
-            labels=['Low', 'Medium', 'High', 'Premium']
-        )
+        # Right-closed buckets (0, avg/2], (avg/2, avg], (avg, 2*avg], (2*avg, inf], as pd.cut would build
+        revenue = df['Revenue'].to_numpy(dtype=np.float64)
+        tier_codes = np.searchsorted(np.array([avg_revenue * 0.5, avg_revenue, avg_revenue * 2]), revenue, side='left')
+        tier_codes[~(revenue > 0)] = -1
+        df['Order_Value_Tier'] = pd.Categorical.from_codes(tier_codes, categories=FeatureEngineer.VALUE_TIERS, ordered=True)
 
         df['Unit_Revenue'] = df['Revenue'] / df['Quantity']
 
@@ -50,39 +68,50 @@ class FeatureEngineer:
 
     @staticmethod
     def _add_product_features(df: pd.DataFrame) -> pd.DataFrame:
-        product_revenue = df.groupby('Product')['Revenue'].sum().sort_values(ascending=False)
-        product_rank = {product: rank + 1 for rank, product in enumerate(product_revenue.index)}
-        df['Product_Revenue_Rank'] = df['Product'].map(product_rank)
+        # Group totals are summed per integer code and broadcast back by indexing with
+        # the same codes, instead of a groupby followed by a dict map per column
+        revenue = df['Revenue'].to_numpy(dtype=np.float64)
 
-        category_revenue = df.groupby('Category')['Revenue'].sum()
-        total_revenue = df['Revenue'].sum()
-        category_share = (category_revenue / total_revenue * 100).to_dict()
-        df['Category_Revenue_Share'] = df['Category'].map(category_share)
+        product_codes, products = pd.factorize(df['Product'])
+        product_revenue = np.bincount(product_codes, weights=revenue, minlength=len(products))
+        product_rank = np.empty(len(products), dtype=np.int64)
+        product_rank[np.argsort(-product_revenue, kind='stable')] = np.arange(1, len(products) + 1)
+        df['Product_Revenue_Rank'] = product_rank[product_codes]
+
+        category_codes, categories = pd.factorize(df['Category'])
+        category_revenue = np.bincount(category_codes, weights=revenue, minlength=len(categories))
+        category_share = category_revenue / revenue.sum() * 100
+        df['Category_Revenue_Share'] = category_share[category_codes]
 
         return df
 
     @staticmethod
     def create_aggregated_metrics(df: pd.DataFrame) -> dict:
+        revenue = df['Revenue']
+        total_revenue = revenue.sum()
+        first_date = df['Order_Date'].min()
+        last_date = df['Order_Date'].max()
+
         metrics = {
-            'total_revenue': df['Revenue'].sum(),
+            'total_revenue': total_revenue,
             'total_orders': len(df),
-            'average_order_value': df['Revenue'].mean(),
+            'average_order_value': total_revenue / revenue.count() if revenue.count() else np.nan,
             'total_units_sold': df['Quantity'].sum(),
             'unique_products': df['Product'].nunique(),
             'unique_categories': df['Category'].nunique(),
             'unique_customers': df['Customer_Type'].nunique(),
             'date_range': {
-                'start': df['Order_Date'].min(),
-                'end': df['Order_Date'].max(),
-                'days': (df['Order_Date'].max() - df['Order_Date'].min()).days
+                'start': first_date,
+                'end': last_date,
+                'days': (last_date - first_date).days
             }
         }
 
-        monthly_revenue = df.groupby('Year_Month')['Revenue'].sum().sort_index()
+        monthly_revenue = revenue.groupby(df['Year_Month'], observed=True, sort=True).sum().to_numpy(dtype=np.float64)
 
         if len(monthly_revenue) > 1:
-            first_month = monthly_revenue.iloc[0]
-            last_month = monthly_revenue.iloc[-1]
+            first_month = monthly_revenue[0]
+            last_month = monthly_revenue[-1]
 
             if first_month > 0:
                 total_growth = ((last_month - first_month) / first_month) * 100
@@ -90,8 +119,10 @@ class FeatureEngineer:
             else:
                 metrics['total_growth_pct'] = 0
 
-            monthly_changes = monthly_revenue.pct_change().dropna() * 100
-            metrics['avg_monthly_growth'] = monthly_changes.mean()
+            with np.errstate(divide='ignore', invalid='ignore'):
+                monthly_changes = np.diff(monthly_revenue) / monthly_revenue[:-1] * 100
+            monthly_changes = monthly_changes[~np.isnan(monthly_changes)]
+            metrics['avg_monthly_growth'] = monthly_changes.mean() if len(monthly_changes) else np.nan
         else:
             metrics['total_growth_pct'] = 0
             metrics['avg_monthly_growth'] = 0
@@ -1,70 +1,179 @@
+import os
 import pandas as pd
 import numpy as np
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from typing import Dict, Tuple
-from statsmodels.tsa.holtwinters import ExponentialSmoothing
-from statsmodels.tsa.arima.model import ARIMA
 
-warnings.filterwarnings('ignore')
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+
+def _recursive_moving_average(tail: np.ndarray, window: int, periods: int) -> np.ndarray:
+    # Each prediction is the mean of the window before it, so the forecast is written
+    # into one preallocated buffer that starts with the historical tail and the
+    # window sum is rolled forward instead of re-reduced every step
+    n_tail = len(tail)
+    buffer = np.empty(n_tail + periods)
+    buffer[:n_tail] = tail
+    window_sum = tail.sum()
+    for i in range(n_tail, n_tail + periods):
+        buffer[i] = window_sum / min(i, window)
+        window_sum += buffer[i]
+        if i >= window:
+            window_sum -= buffer[i - window]
+
+    return buffer[n_tail:]
 
 
 class SalesForecaster:
 
+    METHODS = ['moving_average', 'exponential_smoothing', 'arima']
+
+    INTERPRETATIONS = {
+        'GROWTH': (
+            "Sales forecast shows %.1f%% growth. "
+            "RECOMMENDATIONS: Increase inventory, expand capacity, invest in marketing. "
+            "Monitor fulfillment capabilities to handle increased demand."
+        ),
+        'DECLINE': (
+            "Sales forecast shows %.1f%% decline. "
+            "RECOMMENDATIONS: Review pricing strategy, investigate competition, "
+            "enhance marketing efforts. Consider cost reduction measures."
+        ),
+        'STABLE': (
+            "Sales forecast shows stable pattern (%.1f%% change). "
+            "RECOMMENDATIONS: Maintain current operations, focus on efficiency, "
+            "explore new growth opportunities."
+        )
+    }
+
     def __init__(self, df: pd.DataFrame):
         self.df = df
         self.monthly_revenue = None
         self.forecast_results = None
+        self._series_key = None
+        self._fit_cache = {}
+        self._future_dates_cache = {}
 
     def prepare_time_series(self) -> pd.Series:
-        self.df['Order_Date'] = pd.to_datetime(self.df['Order_Date'])
-        self.df['Year_Month'] = self.df['Order_Date'].dt.to_period('M')
-
-        self.monthly_revenue = self.df.groupby('Year_Month')['Revenue'].sum().sort_index()
+        order_dates = self.df['Order_Date']
+        if not pd.api.types.is_datetime64_any_dtype(order_dates):
+            order_dates = pd.to_datetime(order_dates)
+
+        # Bucket revenue by integer month ordinal with np.bincount; as with a groupby,
+        # only months that have orders appear and rows without a date are skipped
+        months = order_dates.to_numpy().astype('datetime64[M]')
+        dated = ~np.isnat(months)
+        ordinals = months[dated].astype(np.int64)
+        first_month = ordinals.min() if len(ordinals) else 0
+
+        month_idx = ordinals - first_month
+        revenue = np.nan_to_num(self.df['Revenue'].to_numpy(dtype=np.float64)[dated])
+        totals = np.bincount(month_idx, weights=revenue)
+        observed = np.bincount(month_idx) > 0
+
+        self.monthly_revenue = pd.Series(
+            totals[observed],
+            index=pd.PeriodIndex.from_ordinals(np.flatnonzero(observed) + first_month, freq='M', name='Year_Month'),
+            name='Revenue'
+        )
+        self._series_key = self._source_key()
 
         return self.monthly_revenue
 
-    def moving_average_forecast(self, window: int = 3, periods: int = 6) -> Dict:
-        if self.monthly_revenue is None:
-            self.prepare_time_series()
+    def _source_key(self) -> tuple:
+        # Identifies the frame the monthly series was built from; a swapped frame, appended
+        # orders or an in-place edit of the two source columns force a rebuild. Hashing the
+        # raw buffers costs a fraction of rebuilding the series
+        digests = []
+        for col in ('Order_Date', 'Revenue'):
+            values = self.df[col].to_numpy()
+            if values.dtype.kind in 'biufmM':
+                digests.append(hash(values.tobytes()))
+            else:
+                digests.append(int(pd.util.hash_pandas_object(self.df[col], index=False).sum()))
+
+        return (id(self.df), len(self.df), *digests)
+
+    def _future_dates(self, periods: int) -> pd.DatetimeIndex:
+        # Month starts after the last observed month, from datetime64[M] arithmetic
+        last_month = self.monthly_revenue.index[-1].ordinal
+        key = (last_month, periods)
+        if key not in self._future_dates_cache:
+            months = np.datetime64(last_month, 'M') + np.arange(1, periods + 1)
+            self._future_dates_cache[key] = pd.DatetimeIndex(months.astype('datetime64[ns]'), freq='MS')
+
+        return self._future_dates_cache[key]
+
+    def _pack_result(self, method: str, forecast_values, std_dev: float, periods: int, **details) -> Dict:
+        # The 95% band is computed on the raw arrays and stored in one frame sharing the
+        # future index; the per-series keys are column views of it for existing callers
+        values = np.asarray(forecast_values, dtype=np.float64)
+        band = 1.96 * std_dev
+        forecast_frame = pd.DataFrame(
+            {'forecast': values, 'lower': values - band, 'upper': values + band},
+            index=self._future_dates(periods)
+        )
 
-        historical_values = self.monthly_revenue.values
-        predictions = []
+        return {
+            'method': method,
+            'forecast_frame': forecast_frame,
+            'forecast': forecast_frame['forecast'],
+            'lower_bound': forecast_frame['lower'],
+            'upper_bound': forecast_frame['upper'],
+            **details
+        }
 
-        for i in range(periods):
-            if i == 0:
-                last_n = historical_values[-window:]
-            else:
-                last_n = list(historical_values[-window:]) + predictions[-min(i, window):]
-                last_n = last_n[-window:]
+    def _fit_model(self, name: str, params: tuple, build, pooled: bool = False):
+        # Fitted models are memoised on the monthly series itself, so repeat forecasts
+        # (including a different horizon) reuse the optimisation instead of refitting
+        key = (name, params, self.monthly_revenue.to_numpy(dtype=np.float64).tobytes())
+        if key not in self._fit_cache:
+            # Pooled entry points set up the fit environment once outside their workers;
+            # threadpoolctl limits and warning filters are process-wide, so their
+            # set-and-restore must not run concurrently per fit
+            with nullcontext() if pooled else self._fit_environment():
+                self._fit_cache[key] = build().fit()
 
-            pred = np.mean(last_n)
-            predictions.append(pred)
+        return self._fit_cache[key]
 
-        last_date = self.monthly_revenue.index[-1].to_timestamp()
-        future_dates = pd.date_range(
-            start=last_date + pd.DateOffset(months=1),
-            periods=periods,
-            freq='MS'
-        )
+    @staticmethod
+    def _single_thread_blas():
+        # Monthly series are tiny, so multi-threaded BLAS spends more on dispatch than on the math
+        return threadpool_limits(limits=1, user_api='blas') if threadpool_limits else nullcontext()
 
-        forecast_series = pd.Series(predictions, index=future_dates)
+    @staticmethod
+    @contextmanager
+    def _fit_environment():
+        # Convergence chatter from the model fits is not actionable on the dashboard.
+        # statsmodels adds 'always' filters for its own warnings when first imported, so
+        # it is loaded before the ignore filter goes on top (pool workers import lazily)
+        import statsmodels.tools.sm_exceptions  # noqa: F401
 
-        std_dev = np.std(historical_values[-window:])
-        lower_bound = forecast_series - (1.96 * std_dev)
-        upper_bound = forecast_series + (1.96 * std_dev)
+        with SalesForecaster._single_thread_blas(), warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            yield
 
-        return {
-            'method': 'Moving Average',
-            'forecast': forecast_series,
-            'lower_bound': lower_bound,
-            'upper_bound': upper_bound,
-            'explanation': f"Forecast based on average of last {window} months. "
-                          f"Assumes stable sales pattern without strong trends.",
-            'confidence': 'Medium - Best for stable markets',
-            'parameters': {'window': window}
-        }
+    def moving_average_forecast(self, window: int = 3, periods: int = 6) -> Dict:
+        if self.monthly_revenue is None:
+            self.prepare_time_series()
+
+        tail = self.monthly_revenue.to_numpy(dtype=np.float64)[-window:]
+        predictions = _recursive_moving_average(tail, window, periods)
 
-    def exponential_smoothing_forecast(self, periods: int = 6) -> Dict:
+        return self._pack_result(
+            'Moving Average', predictions, tail.std(), periods,
+            explanation=f"Forecast based on average of last {window} months. "
+                        f"Assumes stable sales pattern without strong trends.",
+            confidence='Medium - Best for stable markets',
+            parameters={'window': window}
+        )
+
+    def exponential_smoothing_forecast(self, periods: int = 6, pooled: bool = False) -> Dict:
         if self.monthly_revenue is None:
             self.prepare_time_series()
 
@@ -74,46 +183,33 @@ class SalesForecaster:
                 'message': 'Need at least 6 months of historical data for reliable exponential smoothing'
             }
 
+        # statsmodels is imported on first use so the moving average path never loads it
+        from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
         try:
-            model = ExponentialSmoothing(
+            fitted_model = self._fit_model('exponential_smoothing', ('add', None), lambda: ExponentialSmoothing(
                 self.monthly_revenue.values,
                 trend='add',
                 seasonal=None,
                 initialization_method="estimated"
-            )
-            fitted_model = model.fit()
+            ), pooled)
 
             forecast_values = fitted_model.forecast(steps=periods)
 
-            last_date = self.monthly_revenue.index[-1].to_timestamp()
-            future_dates = pd.date_range(
-                start=last_date + pd.DateOffset(months=1),
-                periods=periods,
-                freq='MS'
-            )
-
-            forecast_series = pd.Series(forecast_values, index=future_dates)
-
-            residuals = fitted_model.fittedvalues - self.monthly_revenue.values
-            std_dev = np.std(residuals)
-
-            lower_bound = forecast_series - (1.96 * std_dev)
-            upper_bound = forecast_series + (1.96 * std_dev)
+            # The fit already holds its residuals, so no fitted-minus-actual temporary is needed
+            std_dev = fitted_model.resid.std()
 
-            return {
-                'method': 'Exponential Smoothing',
-                'forecast': forecast_series,
-                'lower_bound': lower_bound,
-                'upper_bound': upper_bound,
-                'explanation': "Forecast using weighted average with more importance on recent months. "
-                              "Captures trend direction (growth/decline). "
-                              "Confidence intervals show 95% prediction range.",
-                'confidence': 'High - Recommended for trending data',
-                'parameters': {
+            return self._pack_result(
+                'Exponential Smoothing', forecast_values, std_dev, periods,
+                explanation="Forecast using weighted average with more importance on recent months. "
+                            "Captures trend direction (growth/decline). "
+                            "Confidence intervals show 95% prediction range.",
+                confidence='High - Recommended for trending data',
+                parameters={
                     'trend': 'additive',
                     'seasonal': None
                 }
-            }
+            )
 
         except Exception as e:
             return {
@@ -121,7 +217,7 @@ class SalesForecaster:
                 'message': 'Exponential smoothing failed - data may be too irregular'
             }
 
-    def arima_forecast(self, order: Tuple[int, int, int] = (1, 1, 1), periods: int = 6) -> Dict:
+    def arima_forecast(self, order: Tuple[int, int, int] = (1, 1, 1), periods: int = 6, pooled: bool = False) -> Dict:
         if self.monthly_revenue is None:
             self.prepare_time_series()
 
@@ -131,44 +227,28 @@ class SalesForecaster:
                 'message': 'ARIMA requires at least 12 months of historical data'
             }
 
-        try:
-            model = ARIMA(self.monthly_revenue.values, order=order)
-            fitted_model = model.fit()
-
-            forecast_result = fitted_model.forecast(steps=periods)
-            forecast_values = forecast_result
-
-            last_date = self.monthly_revenue.index[-1].to_timestamp()
-            future_dates = pd.date_range(
-                start=last_date + pd.DateOffset(months=1),
-                periods=periods,
-                freq='MS'
-            )
+        from statsmodels.tsa.arima.model import ARIMA
 
-            forecast_series = pd.Series(forecast_values, index=future_dates)
+        try:
+            fitted_model = self._fit_model('arima', tuple(order), lambda: ARIMA(self.monthly_revenue.values, order=order), pooled)
 
-            residuals = fitted_model.resid
-            std_dev = np.std(residuals)
+            forecast_values = fitted_model.forecast(steps=periods)
 
-            lower_bound = forecast_series - (1.96 * std_dev)
-            upper_bound = forecast_series + (1.96 * std_dev)
+            std_dev = fitted_model.resid.std()
 
-            return {
-                'method': 'ARIMA',
-                'forecast': forecast_series,
-                'lower_bound': lower_bound,
-                'upper_bound': upper_bound,
-                'explanation': f"Statistical forecast using ARIMA{order}. "
-                              f"Model analyzes historical patterns, trends, and cycles. "
-                              f"95% confidence interval provided.",
-                'confidence': 'Very High - Best for long-term planning',
-                'parameters': {
+            return self._pack_result(
+                'ARIMA', forecast_values, std_dev, periods,
+                explanation=f"Statistical forecast using ARIMA{order}. "
+                            f"Model analyzes historical patterns, trends, and cycles. "
+                            f"95% confidence interval provided.",
+                confidence='Very High - Best for long-term planning',
+                parameters={
                     'order': order,
                     'p': f"{order[0]} (past values used)",
                     'd': f"{order[1]} (trend removal)",
                     'q': f"{order[2]} (error correction)"
                 }
-            }
+            )
 
         except Exception as e:
             return {
@@ -177,14 +257,53 @@ class SalesForecaster:
             }
 
     def generate_forecast(self, method: str = 'exponential_smoothing', periods: int = 6) -> Dict:
-        self.prepare_time_series()
+        if self.monthly_revenue is None or self._series_key != self._source_key():
+            self.prepare_time_series()
+
+        result = self._run_forecast(method, periods)
+
+        self.forecast_results = result
+        return result
+
+    def generate_all_forecasts(self, periods: int = 6) -> Dict:
+        if self.monthly_revenue is None or self._series_key != self._source_key():
+            self.prepare_time_series()
+
+        # The fits are independent; BLAS and the warning filters are set once around the
+        # pool and the workers run in pooled mode so their fits skip their own
+        with self._fit_environment(), ThreadPoolExecutor(max_workers=len(self.METHODS)) as executor:
+            futures = {
+                method: executor.submit(self._run_forecast, method, periods, True)
+                for method in self.METHODS
+            }
+
+        return {method: future.result() for method, future in futures.items()}
+
+    def batch_forecast(self, group_col: str = 'Region', method: str = 'arima', periods: int = 6) -> Dict:
+        # One forecaster per segment, fitted side by side on at most one thread per core;
+        # each builds its own monthly series and relies on the fit environment set around the pool
+        segments = {
+            value: SalesForecaster(segment)
+            for value, segment in self.df.groupby(group_col, observed=True, sort=False)
+        }
 
+        max_workers = max(min(len(segments), os.cpu_count() or 1), 1)
+        with self._fit_environment(), ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                value: executor.submit(forecaster._run_forecast, method, periods, True)
+                for value, forecaster in segments.items()
+            }
+
+        return {value: future.result() for value, future in futures.items()}
+
+    def _run_forecast(self, method: str, periods: int, pooled: bool = False) -> Dict:
+        # pooled is set by callers that already hold the fit environment around their workers
         if method == 'moving_average':
             result = self.moving_average_forecast(periods=periods)
         elif method == 'exponential_smoothing':
-            result = self.exponential_smoothing_forecast(periods=periods)
+            result = self.exponential_smoothing_forecast(periods=periods, pooled=pooled)
         elif method == 'arima':
-            result = self.arima_forecast(periods=periods)
+            result = self.arima_forecast(periods=periods, pooled=pooled)
         else:
             return {
                 'error': 'Invalid method',
@@ -195,19 +314,19 @@ class SalesForecaster:
             result['historical_data'] = self.monthly_revenue
             result['forecast_period_months'] = periods
 
-        self.forecast_results = result
         return result
 
     def get_forecast_summary(self) -> Dict:
         if self.forecast_results is None or 'error' in self.forecast_results:
             return {'error': 'No valid forecast available'}
 
-        forecast = self.forecast_results['forecast']
-        historical = self.forecast_results['historical_data']
+        # Reduce the raw arrays; the NaN-aware reductions keep the Series skipna semantics
+        forecast = self.forecast_results['forecast'].to_numpy()
+        historical = self.forecast_results['historical_data'].to_numpy()
 
-        total_forecast_revenue = forecast.sum()
-        avg_monthly_forecast = forecast.mean()
-        avg_historical = historical[-6:].mean()
+        total_forecast_revenue = np.nansum(forecast)
+        avg_monthly_forecast = np.nanmean(forecast)
+        avg_historical = np.nanmean(historical[-6:])
 
         if avg_historical > 0:
             pct_change = ((avg_monthly_forecast - avg_historical) / avg_historical) * 100
@@ -227,21 +346,4 @@ class SalesForecaster:
 
     @staticmethod
     def _interpret_forecast(pct_change: float, trend: str) -> str:
-        if trend == 'GROWTH':
-            return (
-                f"Sales forecast shows {abs(pct_change):.1f}% growth. "
-                f"RECOMMENDATIONS: Increase inventory, expand capacity, invest in marketing. "
-                f"Monitor fulfillment capabilities to handle increased demand."
-            )
-        elif trend == 'DECLINE':
-            return (
-                f"Sales forecast shows {abs(pct_change):.1f}% decline. "
-                f"RECOMMENDATIONS: Review pricing strategy, investigate competition, "
-                f"enhance marketing efforts. Consider cost reduction measures."
-            )
-        else:
-            return (
-                f"Sales forecast shows stable pattern ({abs(pct_change):.1f}% change). "
-                f"RECOMMENDATIONS: Maintain current operations, focus on efficiency, "
-                f"explore new growth opportunities."
-            )
+        return SalesForecaster.INTERPRETATIONS.get(trend, SalesForecaster.INTERPRETATIONS['STABLE']) % abs(pct_change)
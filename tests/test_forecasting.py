@@ -0,0 +1,60 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.forecasting import SalesForecaster
+
+
+def make_orders(n_months: int = 30, regions=('North', 'South', 'East'), seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    month_starts = pd.date_range('2021-01-01', periods=n_months, freq='MS')
+    rows_per_month = 40
+    n = n_months * rows_per_month
+
+    order_dates = np.repeat(month_starts.values, rows_per_month) + rng.integers(0, 28, n).astype('timedelta64[D]')
+    trend = np.repeat(np.arange(n_months), rows_per_month)
+
+    return pd.DataFrame({
+        'Order_ID': np.arange(n),
+        'Order_Date': order_dates,
+        'Revenue': rng.uniform(50, 500, n) + trend * 5.0,
+        'Region': pd.Categorical(rng.choice(list(regions), n))
+    })
+
+
+class TestPooledForecasts(unittest.TestCase):
+
+    def assert_same_forecast(self, pooled: dict, direct: dict):
+        self.assertEqual(pooled.keys(), direct.keys())
+        self.assertNotIn('error', direct)
+        for key in ('forecast', 'lower_bound', 'upper_bound', 'historical_data'):
+            pd.testing.assert_series_equal(pooled[key], direct[key], check_freq=False)
+
+    def test_generate_all_forecasts_matches_direct_calls(self):
+        df = make_orders()
+        results = SalesForecaster(df).generate_all_forecasts(periods=6)
+
+        self.assertEqual(list(results), SalesForecaster.METHODS)
+        for method, pooled in results.items():
+            direct = SalesForecaster(df).generate_forecast(method=method, periods=6)
+            self.assert_same_forecast(pooled, direct)
+
+    def test_batch_forecast_matches_per_segment_calls(self):
+        df = make_orders()
+        for method in SalesForecaster.METHODS:
+            results = SalesForecaster(df).batch_forecast('Region', method=method, periods=4)
+
+            self.assertEqual(set(results), set(df['Region'].cat.categories))
+            for region, pooled in results.items():
+                segment = df[df['Region'] == region]
+                direct = SalesForecaster(segment).generate_forecast(method=method, periods=4)
+                self.assert_same_forecast(pooled, direct)
+
+
+if __name__ == '__main__':
+    unittest.main()